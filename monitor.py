@@ -3,6 +3,7 @@
 import curses
 import docker
 import psutil
+import threading
 import time
 import subprocess
 import re
@@ -13,6 +14,23 @@ class SystemMonitor:
     """
     A terminal-based system and Docker container monitor using curses.
     """
+
+    # Matches DNAT rules like
+    # `-A DOCKER ... --dport 54772 ... DNAT --to-destination 172.17.0.2:80`
+    _DNAT_RE = re.compile(r'--dport\s+(\d+).*--to-destination\s+([\d.]+):(\d+)')
+
+    # Docker states form a small closed set; classify each row once per
+    # refresh instead of substring-scanning the status on every draw.
+    _STATUS_KIND = {
+        'running': 'up',
+        'exited': 'exited',
+        'dead': 'exited',
+        'created': 'other',
+        'paused': 'other',
+        'restarting': 'other',
+        'removing': 'other',
+    }
+
     def __init__(self):
         self.docker_client = None
         self.docker_error = None
@@ -25,57 +43,148 @@ class SystemMonitor:
         self.selected_index = 0
         self.scroll_pos = 0
         self.status_message = ""
+
+        # Per-pane dirty flags; a pane is repainted only when its model
+        # changed since the last draw.
+        self._dirty_stats = True
+        self._dirty_list = True
+        self._dirty_footer = True
+        self._last_header_sec = -1
+
+        # Subwindows are reused across frames and only recreated when
+        # the terminal size changes.
+        self._stats_win = None
+        self._list_win = None
+        self._last_size = (0, 0)
         self.total_cpus = psutil.cpu_count(logical=False)
 
+        # Host CPU/RAM are sampled once per second in a background
+        # thread; draws read the cached values without blocking.
+        #
+        # psutil.cpu_percent(interval=None) compares against the counters
+        # recorded by the previous call, so one priming call must happen
+        # here before the sampler reads it; the first real sample would
+        # otherwise report a meaningless 0.0. Never call the blocking
+        # interval>0 form from the draw path. If per-CPU bars are added,
+        # prime psutil.cpu_percent(percpu=True, interval=None) the same
+        # way, and batch any future per-process reads in Process.oneshot().
+        psutil.cpu_percent(interval=None)
+        self._cpu = 0.0
+        self._mem = psutil.virtual_memory()
+        threading.Thread(target=self._sample_system_stats, daemon=True).start()
+
+        # Latest stats sample per container id, fed by one streaming
+        # reader thread per container so the UI never blocks on dockerd.
+        self._stats_cache: Dict[str, Dict] = {}
+        self._stats_threads: Dict[str, threading.Thread] = {}
+        self._stats_stopped: set = set()
+
+        # DNAT rules indexed per refresh; None means "not read yet".
+        self._dnat_map = None
+
+        # Start times cached as epoch seconds per container id so uptime
+        # needs one inspect (and one ISO parse) per container lifetime.
+        self._started_epoch: Dict[str, float] = {}
+
+        # Container rows keyed by full id, mutated in place across
+        # refreshes; the sorted id order is rebuilt only when containers
+        # appear, disappear or are renamed.
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._sorted_cids: List[str] = []
+
+        # Floor between consecutive list rebuilds so event bursts and
+        # key repeats coalesce into one refresh.
+        self._last_refresh = 0.0
+
+        # Set whenever dockerd reports a lifecycle event so the main
+        # loop only rebuilds the container list when something changed.
+        self._dirty = threading.Event()
+        self._dirty.set()
+        if self.docker_client:
+            threading.Thread(target=self._watch_docker_events, daemon=True).start()
+
     # --- Data Fetching ---
 
+    def _watch_docker_events(self):
+        """Thread body: marks the container list dirty on lifecycle events."""
+        events = ['start', 'die', 'create', 'destroy', 'rename', 'pause', 'unpause']
+        while True:
+            try:
+                for ev in self.docker_client.events(decode=True, filters={'event': events}):
+                    # A restart changes StartedAt, so a cached epoch must not
+                    # survive start/die — the next refresh re-inspects.
+                    if ev.get('status') in ('start', 'die'):
+                        self._started_epoch.pop(ev.get('id'), None)
+                    self._dirty.set()
+            except Exception:
+                # dockerd bounced or the socket dropped; degrade to a slow
+                # poll until the stream comes back.
+                time.sleep(1)
+            self._dirty.set()
+
+    def _sample_system_stats(self):
+        """Thread body: refreshes the cached CPU/RAM readings once per second."""
+        while True:
+            self._cpu = psutil.cpu_percent(interval=1.0)
+            self._mem = psutil.virtual_memory()
+            self._dirty_stats = True
+
     def get_cpu_usage(self) -> float:
-        """Returns CPU usage percentage."""
-        return psutil.cpu_percent(interval=0.1)
+        """Returns the most recent CPU usage percentage."""
+        return self._cpu
 
     def get_ram_usage(self):
-        """Returns RAM usage statistics object."""
-        return psutil.virtual_memory()
+        """Returns the most recent RAM usage statistics object."""
+        return self._mem
 
-    def _get_host_port_from_iptables(self, container_ip: str, container_i_port: str) -> str:
+    def _build_dnat_map(self) -> Dict[tuple, str]:
         """
-        FALLBACK METHOD: Uses `iptables-save` to find the host port.
+        FALLBACK METHOD: Reads the NAT table once via `iptables-save` and
+        indexes DNAT rules as (container_ip, container_port) -> host_port.
         Requires `sudo` and is a Linux-specific method.
         """
-        if not container_ip or not container_i_port:
-            return 'N/A'
-
+        dnat_map = {}
         try:
-            # We look for rules that DNAT (Destination NAT) to the container's IP and port
-            # The format is often like `DNAT to:172.17.0.2:80`
-            command = f"sudo iptables-save | grep 'DNAT.*--to-destination {container_ip}:{container_i_port}'"
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, check=True)
-            output = result.stdout
-
-            if output:
-                # The rule will also contain the host port (e.g., `-A DOCKER ! -i docker0 -p tcp -m tcp --dport 54772 ...`)
-                match = re.search(r'--dport\s+(\d+)', output)
+            result = subprocess.run(
+                "sudo iptables-save -t nat", shell=True,
+                capture_output=True, text=True, check=True
+            )
+            for line in result.stdout.splitlines():
+                if 'DNAT' not in line:
+                    continue
+                match = self._DNAT_RE.search(line)
                 if match:
-                    return match.group(1)
-        except subprocess.CalledProcessError:
-            # This is expected if the grep finds no results
-            pass
+                    host_port, dest_ip, dest_port = match.groups()
+                    dnat_map[(dest_ip, dest_port)] = host_port
         except Exception:
-            return 'Error'
-        
-        return 'N/A'
-    
-    def _get_container_uptime(self, container) -> str:
+            pass  # No sudo/iptables available; all lookups fall back to 'N/A'
+
+        return dnat_map
+
+    def _get_host_port_from_iptables(self, container_ip: str, container_i_port: str) -> str:
+        """Looks up the host port for a container ip:port in the cached DNAT map."""
+        if not container_ip or not container_i_port:
+            return 'N/A'
+        if self._dnat_map is None:
+            self._dnat_map = self._build_dnat_map()
+        return self._dnat_map.get((container_ip, container_i_port), 'N/A')
+
+
+    def _get_container_uptime(self, cid: str, status: str, now_epoch: float) -> str:
         """Calculates and formats the container's uptime."""
         try:
-            status = container.status
             if status == 'running':
-                started_at_str = container.attrs['State']['StartedAt']
-                started_at = datetime.fromisoformat(started_at_str.replace('Z', '+00:00'))
-                now = datetime.now().astimezone(started_at.tzinfo)
-                uptime_delta = now - started_at
-                
-                total_seconds = int(uptime_delta.total_seconds())
+                started_epoch = self._started_epoch.get(cid)
+                if started_epoch is None:
+                    # One inspect per container lifetime; the list endpoint
+                    # does not include StartedAt. StartedAt is always UTC.
+                    attrs = self.docker_client.api.inspect_container(cid)
+                    started_at_str = attrs['State']['StartedAt']
+                    started_epoch = datetime.fromisoformat(
+                        started_at_str.replace('Z', '+00:00')).timestamp()
+                    self._started_epoch[cid] = started_epoch
+
+                total_seconds = int(now_epoch - started_epoch)
                 days, remainder = divmod(total_seconds, 86400)
                 hours, remainder = divmod(remainder, 3600)
                 minutes, seconds = divmod(remainder, 60)
@@ -92,23 +201,80 @@ class SystemMonitor:
                 
                 return "".join(uptime_parts)
             else:
+                self._started_epoch.pop(cid, None)
                 return 'N/A'
-        except (KeyError, ValueError):
+        except Exception:
             return 'Error'
 
-    def _get_container_ram_stats(self, container_obj):
-        """Calculates RAM usage for a given container object."""
+    def _stats_stream_worker(self, cid: str):
+        """Thread body: keeps the newest stats sample for one container."""
+        try:
+            for sample in self.docker_client.api.stats(cid, decode=True, stream=True):
+                if cid in self._stats_stopped:
+                    break
+                self._stats_cache[cid] = sample
+        except Exception:
+            pass  # dockerd hiccup or container gone; thread just exits
+        finally:
+            self._stats_threads.pop(cid, None)
+            self._stats_stopped.discard(cid)
+
+    def _ensure_stats_stream(self, cid: str):
+        """Spawns a streaming stats reader for a container if none is running."""
+        if cid not in self._stats_threads:
+            thread = threading.Thread(
+                target=self._stats_stream_worker, args=(cid,), daemon=True
+            )
+            self._stats_threads[cid] = thread
+            thread.start()
+
+    def _stop_stats_stream(self, cid: str):
+        """Signals a container's stats reader to stop and drops its cache entry."""
+        if cid in self._stats_threads:
+            self._stats_stopped.add(cid)
+        self._stats_cache.pop(cid, None)
+
+    def _read_cgroup_mem(self, cid: str):
+        """
+        Reads a container's memory usage straight from its cgroup — a tiny
+        file read instead of an HTTP stats round-trip. Returns None where
+        the cgroup is not visible (non-Linux, Docker Desktop, cgroup v1
+        layouts other than the standard one).
+        """
+        for path in (
+            f'/sys/fs/cgroup/system.slice/docker-{cid}.scope/memory.current',
+            f'/sys/fs/cgroup/memory/docker/{cid}/memory.usage_in_bytes',
+        ):
+            try:
+                with open(path) as f:
+                    return int(f.read())
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def _get_container_ram_stats(self, cid: str, status: str):
+        """Returns RAM usage, preferring a direct cgroup read over the stats API."""
+        if status != 'running':
+            return 'N/A'
+
+        mem_bytes = self._read_cgroup_mem(cid)
+        if mem_bytes is not None:
+            return f"{mem_bytes / (1024**3):.2f}G"
+
+        # Fall back to the latest streamed stats sample; only hosts whose
+        # cgroups we cannot read need a stream at all.
+        self._ensure_stats_stream(cid)
         mem_usage_gb = 'N/A'
         try:
-            stats = container_obj.stats(stream=False)
-            
-            # --- RAM Usage Calculation ---
-            mem_usage_bytes = stats['memory_stats']['usage']
-            mem_usage_gb = f"{mem_usage_bytes / (1024**3):.2f}G"
+            stats = self._stats_cache.get(cid)
+            if stats:
+                # --- RAM Usage Calculation ---
+                mem_usage_bytes = stats['memory_stats']['usage']
+                mem_usage_gb = f"{mem_usage_bytes / (1024**3):.2f}G"
 
         except Exception:
             pass # Keep previous 'N/A' values
-        
+
         return mem_usage_gb
 
     def get_docker_containers(self) -> List[Dict[str, Any]]:
@@ -118,88 +284,177 @@ class SystemMonitor:
         if self.docker_error:
             return []
         
-        containers = []
+        seen_ids = set()
+        membership_changed = False
+        self._dnat_map = None  # re-read iptables at most once this refresh
+        now_epoch = time.time()
         try:
-            for container in self.docker_client.containers.list(all=True):
-                attrs = container.attrs
-                
+            # One HTTP call for the whole list; the raw dicts already carry
+            # names, state, image and port data, so no per-container model
+            # objects (or their lazy inspect calls) are needed.
+            for raw in self.docker_client.api.containers(all=True):
+                cid = raw['Id']
+                status = raw.get('State', 'unknown')
+                seen_ids.add(cid)
+
+                # Only running containers produce stats; streaming from a
+                # stopped one would just hold an idle HTTP connection.
+                # (The RAM lookup starts a stream itself when it has to
+                # fall back to the stats API.)
+                if status != 'running':
+                    self._stop_stats_stream(cid)
+
                 ports = 'N/A'
                 ip_addr = 'N/A'
 
                 # --- Step 1: Get IP address from NetworkSettings (needed for iptables fallback) ---
-                networks = attrs.get('NetworkSettings', {}).get('Networks', {})
+                networks = raw.get('NetworkSettings', {}).get('Networks', {})
                 for network_name, network_info in networks.items():
                     if network_info.get('IPAddress'):
                         ip_addr = network_info['IPAddress']
                         break
 
-                # --- Step 2: Get ports from the container's attributes ---
-                port_data = attrs.get('NetworkSettings', {}).get('Ports', {})
+                # --- Step 2: Get ports from the list response ---
+                port_data = raw.get('Ports') or []
                 if port_data:
                     port_list = []
-                    for container_port_key, host_ports_info in port_data.items():
-                        container_i_port = container_port_key.split('/')[0]
-                        
-                        host_port_num = 'N/A'
-                        if host_ports_info and len(host_ports_info) > 0:
-                            host_port_binding = host_ports_info[0]
-                            host_port_num = host_port_binding.get('HostPort', 'N/A')
-                        
+                    seen_ports = set()
+                    for port_info in port_data:
+                        container_i_port = str(port_info.get('PrivatePort', ''))
+                        if container_i_port in seen_ports:
+                            continue  # v4/v6 bindings repeat the same port
+                        seen_ports.add(container_i_port)
+
+                        host_port_num = str(port_info['PublicPort']) if port_info.get('PublicPort') else 'N/A'
+
                         # --- Step 3: Use iptables fallback if host port is still 'N/A' ---
                         if host_port_num == 'N/A':
                            host_port_num = self._get_host_port_from_iptables(ip_addr, container_i_port)
-                        
+
                         # --- Step 4: Format the port string cleanly ---
                         if host_port_num != 'N/A':
                             port_list.append(f"{host_port_num}->{container_i_port}")
                         else:
                             port_list.append(f"{container_i_port}")
-                            
+
                     ports = ",".join(port_list)
-                
-                ram_usage = self._get_container_ram_stats(container)
-
-                containers.append({
-                    'id': container.short_id,
-                    'name': container.name,
-                    'status': container.status,
-                    'image': container.image.tags[0] if container.image.tags else container.image.short_id,
-                    'ports': ports,
-                    'uptime': self._get_container_uptime(container),
-                    'ram': ram_usage,
-                    'obj': container
-                })
+
+                ram_usage = self._get_container_ram_stats(cid, status)
+
+                # The list response gives the image reference directly; an
+                # untagged image shows up as a raw digest, so shorten it.
+                image = raw.get('Image', 'N/A')
+                if image.startswith('sha256:'):
+                    image = image[len('sha256:'):][:12]
+
+                name = raw['Names'][0].lstrip('/') if raw.get('Names') else cid[:12]
+                uptime = self._get_container_uptime(cid, status, now_epoch)
+
+                kind = self._STATUS_KIND.get(status, 'other')
+
+                row = self._rows.get(cid)
+                if row is None:
+                    self._rows[cid] = {
+                        'id': cid[:12],
+                        'name': name,
+                        'status': status,
+                        '_kind': kind,
+                        'image': image,
+                        'ports': ports,
+                        'uptime': uptime,
+                        'ram': ram_usage,
+                    }
+                    membership_changed = True
+                else:
+                    # Mutate the existing row so the rendered list stays a
+                    # stable view instead of a rebuilt pile of dicts.
+                    if row['name'] != name:
+                        membership_changed = True  # order is by name
+                    row['name'] = name
+                    row['status'] = status
+                    row['_kind'] = kind
+                    row['image'] = image
+                    row['ports'] = ports
+                    row['uptime'] = uptime
+                    row['ram'] = ram_usage
         except Exception as e:
             self.docker_error = f"Docker error: {str(e)}"
             return []
-            
-        return sorted(containers, key=lambda c: c['name'])
 
+        # Drop rows and stream readers for containers that disappeared.
+        for cid in list(self._rows):
+            if cid not in seen_ids:
+                del self._rows[cid]
+                membership_changed = True
+                self._stop_stats_stream(cid)
+                self._started_epoch.pop(cid, None)
+
+        if membership_changed:
+            self._sorted_cids = sorted(self._rows, key=lambda c: self._rows[c]['name'])
+
+        return [self._rows[cid] for cid in self._sorted_cids]
+
+
+    def _refresh_live_fields(self) -> bool:
+        """
+        Recomputes uptime and RAM for running rows from cached data only —
+        no dockerd round-trips — so the columns keep moving between
+        lifecycle events. Returns True if any row was touched.
+        """
+        now_epoch = time.time()
+        changed = False
+        for cid, row in self._rows.items():
+            if row['status'] != 'running':
+                continue
+            # Skip uptime if the start epoch is not cached; filling it
+            # would cost an inspect call, which the next full refresh pays.
+            if cid in self._started_epoch:
+                row['uptime'] = self._get_container_uptime(cid, row['status'], now_epoch)
+            row['ram'] = self._get_container_ram_stats(cid, row['status'])
+            changed = True
+        return changed
+
+    def _maybe_refresh(self, force: bool = False):
+        """
+        Rebuilds the container list unless one was built within the last
+        second. Returns the new list, or None if the refresh was skipped.
+        """
+        now = time.monotonic()
+        if force or now - self._last_refresh > 1.0:
+            self._last_refresh = now
+            return self.get_docker_containers()
+        return None
 
     # --- Container Actions ---
-    
+
+    def _set_status(self, message: str):
+        """Updates the status message and marks the footer for repaint."""
+        self.status_message = message
+        self._dirty_footer = True
+
     def _perform_action(self, action_name: str, containers: List[Dict], new_name: str = None):
         if not containers or self.docker_error:
             return
 
-        container_obj = containers[self.selected_index]['obj']
-        
         try:
+            # Resolve a model handle only now; the list rows are plain dicts.
+            container_obj = self.docker_client.containers.get(
+                containers[self.selected_index]['id'])
             if action_name == 'rename':
                 container_obj.rename(new_name)
-                self.status_message = f"Successfully renamed {container_obj.name} to {new_name}."
+                self._set_status(f"Successfully renamed {container_obj.name} to {new_name}.")
             elif action_name == 'remove':
                 container_obj.remove(force=True)
-                self.status_message = f"Successfully removed container {container_obj.name}."
+                self._set_status(f"Successfully removed container {container_obj.name}.")
             elif action_name in ['start', 'stop', 'restart']:
                 action_func = getattr(container_obj, action_name, None)
                 if action_func:
                     action_func()
-                    self.status_message = f"Successfully sent '{action_name}' command to {container_obj.name}."
+                    self._set_status(f"Successfully sent '{action_name}' command to {container_obj.name}.")
             else:
-                self.status_message = f"Action '{action_name}' not available for this container."
+                self._set_status(f"Action '{action_name}' not available for this container.")
         except Exception as e:
-            self.status_message = f"Error: {str(e)}"
+            self._set_status(f"Error: {str(e)}")
 
 
     def _confirm_action(self, stdscr, message: str) -> bool:
@@ -283,25 +538,50 @@ class SystemMonitor:
         curses.init_pair(9, curses.COLOR_WHITE, curses.COLOR_BLUE) # CPU Bar
         curses.init_pair(10, curses.COLOR_WHITE, curses.COLOR_GREEN) # RAM Bar
 
+        # Attribute bitmasks resolved once; curses.color_pair() is a
+        # Python-level call we don't want per row per frame.
+        self.ATTR_HEADER = curses.color_pair(4) | curses.A_BOLD
+        self.ATTR_UP = curses.color_pair(1)
+        self.ATTR_DOWN = curses.color_pair(2)
+        self.ATTR_OTHER = curses.color_pair(3)
+        self.ATTR_SEL = curses.color_pair(5)
+        self.ATTR_SEL_UP = curses.color_pair(6)
+        self.ATTR_SEL_DOWN = curses.color_pair(7)
+        self.ATTR_SEL_OTHER = curses.color_pair(8)
+        self.ATTR_CPU_BAR = curses.color_pair(9)
+        self.ATTR_RAM_BAR = curses.color_pair(10)
+
+        # Status colors indexed by [is_selected][row['_kind']].
+        self.STATUS_ATTR = {
+            False: {'up': self.ATTR_UP, 'exited': self.ATTR_DOWN,
+                    'other': self.ATTR_OTHER},
+            True: {'up': self.ATTR_SEL_UP, 'exited': self.ATTR_SEL_DOWN,
+                   'other': self.ATTR_SEL_OTHER},
+        }
+
 
     def _draw_header(self, stdscr, width: int):
         """Draws the top header with the title and timestamp."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         title = "System & Docker Monitor"
         header_text = f"{title} - {timestamp}"
-        stdscr.attron(curses.color_pair(4) | curses.A_BOLD)
+        stdscr.attron(self.ATTR_HEADER)
         stdscr.addstr(0, (width - len(header_text)) // 2, header_text)
-        stdscr.attroff(curses.color_pair(4) | curses.A_BOLD)
+        stdscr.attroff(self.ATTR_HEADER)
 
     def _draw_system_stats(self, stdscr, width: int):
         """Draws the CPU and RAM statistics section."""
-        stats_win = stdscr.subwin(5, width, 2, 0)
+        if self._stats_win is None:
+            self._stats_win = stdscr.subwin(5, width, 2, 0)
+        stats_win = self._stats_win
         stats_win.box()
-        stats_win.addstr(0, 2, "[ System Resources ]", curses.color_pair(4) | curses.A_BOLD)
+        stats_win.addstr(0, 2, "[ System Resources ]", self.ATTR_HEADER)
         
+        mem = self.get_ram_usage()
+
         # Determine consistent bar width
         cpu_label_text = f"CPU Usage ({self.total_cpus} cores): "
-        ram_text_part = f"RAM Usage: {self.get_ram_usage().used/1e9:0.2f}G / {self.get_ram_usage().total/1e9:0.2f}G"
+        ram_text_part = f"RAM Usage: {mem.used/1e9:0.2f}G / {mem.total/1e9:0.2f}G"
         
         # The bar length will be the remaining width minus a fixed padding.
         # This makes the bars the same length regardless of the label text size.
@@ -314,41 +594,54 @@ class SystemMonitor:
         
         # Color the CPU bar
         stats_win.addstr(2, bar_start_x, "|", curses.A_NORMAL)
-        stats_win.addstr(2, bar_start_x + 1, ' ' * int(bar_width * cpu_percent / 100), curses.color_pair(9))
+        stats_win.addstr(2, bar_start_x + 1, ' ' * int(bar_width * cpu_percent / 100), self.ATTR_CPU_BAR)
         stats_win.addstr(2, bar_start_x + 1 + int(bar_width * cpu_percent / 100), ' ' * (bar_width - int(bar_width * cpu_percent / 100)), curses.A_NORMAL)
         stats_win.addstr(2, bar_start_x + bar_width + 1, "|", curses.A_NORMAL)
         stats_win.addstr(2, bar_start_x + bar_width + 3, f"{cpu_percent:5.1f}%", curses.A_NORMAL)
 
 
         # RAM
-        mem = self.get_ram_usage()
         ram_percent = mem.percent
         stats_win.addstr(3, 2, ram_text_part.ljust(bar_start_x))
         
         # Color the RAM bar
         stats_win.addstr(3, bar_start_x, "|", curses.A_NORMAL)
-        stats_win.addstr(3, bar_start_x + 1, ' ' * int(bar_width * ram_percent / 100), curses.color_pair(10))
+        stats_win.addstr(3, bar_start_x + 1, ' ' * int(bar_width * ram_percent / 100), self.ATTR_RAM_BAR)
         stats_win.addstr(3, bar_start_x + 1 + int(bar_width * ram_percent / 100), ' ' * (bar_width - int(bar_width * ram_percent / 100)), curses.A_NORMAL)
         stats_win.addstr(3, bar_start_x + bar_width + 1, "|", curses.A_NORMAL)
         stats_win.addstr(3, bar_start_x + bar_width + 3, f"{ram_percent:5.1f}%", curses.A_NORMAL)
 
-        stats_win.refresh()
+        stats_win.noutrefresh()
         
+    def _emit_row(self, win, y_pos: int, segments, width: int):
+        """Writes one row as consecutive (text, attr) runs, clipped to the pane."""
+        x = 2
+        for text, attr in segments:
+            if x >= width - 1:
+                break
+            try:
+                win.addnstr(y_pos, x, text, width - 1 - x, attr)
+            except curses.error:
+                pass
+            x += len(text)
+
     def _draw_container_list(self, stdscr, height: int, width: int, containers: List[Dict]):
         """Draws the scrollable list of Docker containers."""
-        list_win = stdscr.subwin(height - 9, width, 8, 0)
+        if self._list_win is None:
+            self._list_win = stdscr.subwin(height - 9, width, 8, 0)
+        list_win = self._list_win
         list_win.erase()
         list_win.box()
-        list_win.addstr(0, 2, "[ Docker Containers ]", curses.color_pair(4) | curses.A_BOLD)
+        list_win.addstr(0, 2, "[ Docker Containers ]", self.ATTR_HEADER)
 
         if self.docker_error:
-            list_win.addstr(2, 2, self.docker_error, curses.color_pair(2))
-            list_win.refresh()
+            list_win.addstr(2, 2, self.docker_error, self.ATTR_DOWN)
+            list_win.noutrefresh()
             return
             
         if not containers:
             list_win.addstr(2, 2, "No Docker containers found.")
-            list_win.refresh()
+            list_win.noutrefresh()
             return
 
         # Define column widths
@@ -383,7 +676,6 @@ class SystemMonitor:
             status_text = f"{container['status']}"
             uptime_text = f"{container['uptime']}"
             ram_text = f"{container['ram']}"
-            status_lower = container['status'].lower()
 
             # Construct the line with fixed-width columns
             line_part1 = f"{container['id']:<{ID_WIDTH}} {container['name']:<{NAME_WIDTH}.{NAME_WIDTH}} {container['image']:<{IMAGE_WIDTH}.{IMAGE_WIDTH}} {ports_text:<{PORT_WIDTH}.{PORT_WIDTH}} "
@@ -391,62 +683,34 @@ class SystemMonitor:
             uptime_str = f"{uptime_text:<{UPTIME_WIDTH}}"
             ram_str = f"{ram_text:<{RAM_WIDTH}}"
 
-            line_end = " " * (width - len(line_part1) - len(status_str) - len(uptime_str) - len(ram_str) - 3)
-            full_line = f"{line_part1}{status_str}{uptime_str}{ram_str}{line_end}"
-
-            if is_selected:
-                base_attr = curses.color_pair(5)
-                if 'up' in status_lower:
-                    status_attr = curses.color_pair(6)
-                elif 'exited' in status_lower:
-                    status_attr = curses.color_pair(7)
-                else:
-                    status_attr = curses.color_pair(8)
-            else:
-                base_attr = curses.A_NORMAL
-                if 'up' in status_lower:
-                    status_attr = curses.color_pair(1)
-                elif 'exited' in status_lower:
-                    status_attr = curses.color_pair(2)
-                else:
-                    status_attr = curses.color_pair(3)
+            base_attr = self.ATTR_SEL if is_selected else curses.A_NORMAL
+            status_attr = self.STATUS_ATTR[is_selected][container.get('_kind', 'other')]
             
-            try:
-                # Print the first part of the line (ID, NAME, IMAGE, PORT)
-                list_win.addstr(y_pos, 2, line_part1, base_attr)
-
-                # Print the STATUS column
-                current_x = 2 + len(line_part1)
-                list_win.addstr(y_pos, current_x, status_str.strip(), status_attr)
-                
-                # Print UPTIME
-                current_x += STATUS_WIDTH
-                list_win.addstr(y_pos, current_x, uptime_str.strip(), curses.color_pair(1))
-
-                # Print RAM
-                current_x += UPTIME_WIDTH + 1
-                list_win.addstr(y_pos, current_x, ram_str.strip(), base_attr)
-
-                # Fill the rest of the line with padding
-                end_x = 2 + len(line_part1) + STATUS_WIDTH + UPTIME_WIDTH + RAM_WIDTH + 4
-                list_win.addstr(y_pos, end_x, " " * (width - end_x -1), base_attr)
-
-            except curses.error:
-                pass
-
-        list_win.refresh()
+            # Pad the final run so selected rows keep their highlight to
+            # the edge without touching the box border.
+            pad_len = max(0, width - 3 - len(line_part1) - len(status_str)
+                          - len(uptime_str) - len(ram_str))
+            segments = [
+                (line_part1, base_attr),
+                (status_str, status_attr),
+                (uptime_str, self.ATTR_UP),
+                (ram_str + ' ' * pad_len, base_attr),
+            ]
+            self._emit_row(list_win, y_pos, segments, width)
+
+        list_win.noutrefresh()
 
     def _draw_footer(self, stdscr, height: int, width: int):
         """Draws the bottom footer with instructions and status messages."""
         keys = "↑/↓: Nav | U: Update | S: Start | X: Stop | R: Restart | N: Rename | D: Delete | Q: Quit"
         stdscr.addstr(height - 1, 1, keys)
-        
+
         if self.status_message:
             # Check for the temporary status message and apply red color
             if "Stopping container" in self.status_message:
-                attr = curses.color_pair(2) | curses.A_BOLD
+                attr = self.ATTR_DOWN | curses.A_BOLD
             else:
-                attr = curses.color_pair(3)
+                attr = self.ATTR_OTHER
             
             stdscr.attron(attr)
             stdscr.addstr(height - 2, 1, f"Status: {self.status_message.ljust(width-10)}")
@@ -462,31 +726,45 @@ class SystemMonitor:
         """The main application loop that handles drawing and input."""
         curses.curs_set(0)
         stdscr.nodelay(1)
-        stdscr.timeout(1000)
-        
+        stdscr.timeout(250)
+
         self._setup_colors()
-        containers = self.get_docker_containers()
+        containers: List[Dict[str, Any]] = []
 
         while True:
             height, width = stdscr.getmaxyx()
-            
+            if (height, width) != self._last_size:
+                self._last_size = (height, width)
+                self._stats_win = None
+                self._list_win = None
+
             key = stdscr.getch()
 
             if key in [ord('q'), ord('Q')]:
                 break
+            elif key == curses.KEY_RESIZE:
+                stdscr.erase()
+                self._dirty_stats = True
+                self._dirty_list = True
+                self._dirty_footer = True
+                self._last_header_sec = -1
             elif key == curses.KEY_UP:
                 self.selected_index = max(0, self.selected_index - 1)
+                self._dirty_list = True
             elif key == curses.KEY_DOWN and containers:
                 self.selected_index = min(len(containers) - 1, self.selected_index + 1)
+                self._dirty_list = True
             elif key in [ord('u'), ord('U')]:
-                containers = self.get_docker_containers()
-                self.status_message = "Container list updated."
+                containers = self._maybe_refresh(force=True)
+                self._dirty_list = True
+                self._set_status("Container list updated.")
             elif key in [ord('s'), ord('S')]:
                 self._perform_action('start', containers)
             elif key in [ord('x'), ord('X')] and containers:
-                self.status_message = "Stopping container, this may take a minute..."
+                self._set_status("Stopping container, this may take a minute...")
                 self._draw_footer(stdscr, height, width)
-                stdscr.refresh()
+                stdscr.noutrefresh()
+                curses.doupdate()
                 self._perform_action('stop', containers)
             elif key in [ord('r'), ord('R')]:
                 self._perform_action('restart', containers)
@@ -500,15 +778,38 @@ class SystemMonitor:
                 if new_name:
                     self._perform_action('rename', containers, new_name)
             
-            if key == -1:
-                containers = self.get_docker_containers()
-
-            self._draw_header(stdscr, width)
-            self._draw_system_stats(stdscr, width)
-            self._draw_container_list(stdscr, height, width, containers)
-            self._draw_footer(stdscr, height, width)
-            stdscr.refresh()
-            time.sleep(0.1)
+            if self._dirty.is_set():
+                # Clear before fetching so an event that lands mid-refresh
+                # re-arms the flag instead of being swallowed.
+                self._dirty.clear()
+                refreshed = self._maybe_refresh()
+                if refreshed is not None:
+                    containers = refreshed
+                    self._dirty_list = True
+                else:
+                    # Rate-limited: re-arm so the next pass retries.
+                    self._dirty.set()
+
+            # Repaint only the panes whose model changed; the header
+            # carries a timestamp, so it repaints once per second, and the
+            # same tick keeps the live uptime/RAM columns moving.
+            now_sec = int(time.monotonic())
+            if now_sec != self._last_header_sec:
+                self._last_header_sec = now_sec
+                self._draw_header(stdscr, width)
+                if self._refresh_live_fields():
+                    self._dirty_list = True
+            if self._dirty_stats:
+                self._dirty_stats = False
+                self._draw_system_stats(stdscr, width)
+            if self._dirty_list:
+                self._dirty_list = False
+                self._draw_container_list(stdscr, height, width, containers)
+            if self._dirty_footer:
+                self._dirty_footer = False
+                self._draw_footer(stdscr, height, width)
+            stdscr.noutrefresh()
+            curses.doupdate()
 
     def run(self):
         """Starts the curses application."""